@@ -1,5 +1,10 @@
 """Модуль для шифрования и дешифрования текста."""
 
+import functools
+from typing import (
+    Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+)
+
 
 class CipherError(Exception):
     """
@@ -52,12 +57,37 @@ def read_alphabet(filepath: str) -> str:
     return alphabet
 
 
+@functools.lru_cache(maxsize=16)
+def _alphabet_tables(alphabet: str) -> Tuple[Dict[str, int], FrozenSet[str], bytes]:
+    """
+    Строит общие для всех шифров таблицы алфавита.
+
+    Результат кэшируется, поэтому для одного и того же алфавита
+    таблицы строятся только один раз за сеанс.
+
+    :param alphabet: Алфавит
+    :type alphabet: str
+    :returns: Словарь «символ → индекс», множество допустимых символов
+              текста (алфавит и пробел) и байты ASCII-символов из него
+    :rtype: Tuple[Dict[str, int], FrozenSet[str], bytes]
+    """
+    char_to_idx = {char: i for i, char in enumerate(alphabet)}
+    allowed = frozenset(alphabet + ' ')
+    allowed_bytes = ''.join(char for char in allowed if char.isascii())
+
+    return char_to_idx, allowed, allowed_bytes.encode('ascii')
+
+
 def validate_text(text: str, alphabet: str) -> None:
     """
     Проверяет, что все символы текста есть в алфавите.
 
-    Функция проходит по каждому символу текста и проверяет его наличие
-    в переданном алфавите. Пробелы игнорируются.
+    Функция проверяет наличие каждого символа текста в переданном
+    алфавите. Пробелы игнорируются. ASCII-текст проверяется одним
+    вызовом bytes.translate, остальной — разностью множеств.
+
+    Шифры проверяют символы во время перевода текста и вызывают эту
+    функцию только после ошибки, чтобы найти первый недопустимый символ.
 
     :param text: Текст для проверки
     :type text: str
@@ -65,11 +95,311 @@ def validate_text(text: str, alphabet: str) -> None:
     :type alphabet: str
     :raises AlphabetError: Если найден символ не из алфавита
     """
+    _, allowed, allowed_bytes = _alphabet_tables(alphabet)
+
+    if text.isascii():
+        invalid = text.encode('ascii').translate(None, allowed_bytes)
+        if invalid:
+            raise AlphabetError(f"Символ '{chr(invalid[0])}' не найден в алфавите")
+        return
+
+    if allowed.issuperset(text):
+        return
+
     for char in text:
-        if char not in alphabet and char != ' ':
+        if char not in allowed:
             raise AlphabetError(f"Символ '{char}' не найден в алфавите")
 
 
+# Для ASCII-строк до ~1 КиБ перевод через bytes.translate быстрее, чем
+# str.translate; на более длинных строках encode/decode обходится дороже
+# выигрыша, и bytes.translate становится медленнее.
+_ASCII_FAST_PATH_LIMIT = 1024
+
+_Tables = Tuple[Dict[int, int], Optional[bytes], Optional[bytes]]
+
+
+class _TranslationTable(dict):
+    """
+    Таблица для str.translate, проверяющая символы во время перевода.
+
+    str.translate обращается к __missing__ только для символов, которых
+    нет в таблице, поэтому проверка текста не требует отдельного прохода.
+    """
+
+    def __missing__(self, code: int) -> int:
+        raise AlphabetError(f"Символ '{chr(code)}' не найден в алфавите")
+
+
+def _substitution_table(alphabet: str, target: str) -> _Tables:
+    """
+    Строит таблицы перевода символов алфавита в символы target.
+
+    Сама функция результат не кэширует: кэшируются вызывающие её
+    _caesar_table и _atbash_table.
+
+    Пробел всегда переводится сам в себя. Помимо таблицы для
+    str.translate, для ASCII-алфавитов строится 256-байтовая таблица
+    для bytes.translate; допустимые байты для проверки текста берутся
+    из общих таблиц алфавита.
+
+    :param alphabet: Алфавит
+    :type alphabet: str
+    :param target: Символы, на которые заменяются символы алфавита
+    :type target: str
+    :returns: Таблица для str.translate, таблица для bytes.translate и
+              допустимые байты (оба None, если алфавит не ASCII)
+    :rtype: Tuple[Dict[int, int], Optional[bytes], Optional[bytes]]
+    """
+    # Пробел добавляется последним и переводится сам в себя, поэтому
+    # он проходит через таблицу без отдельной проверки.
+    source = alphabet + ' '
+    target += ' '
+
+    table = _TranslationTable(str.maketrans(source, target))
+    if not source.isascii():
+        return table, None, None
+
+    _, _, allowed_bytes = _alphabet_tables(alphabet)
+    byte_table = bytes.maketrans(source.encode('ascii'), target.encode('ascii'))
+
+    return table, byte_table, allowed_bytes
+
+
+@functools.lru_cache(maxsize=64)
+def _caesar_table(alphabet: str, shift: int) -> _Tables:
+    """
+    Возвращает таблицы перевода для сдвига алфавита.
+
+    Таблицы кэшируются по паре (алфавит, сдвиг), поэтому при повторном
+    вызове сдвинутый алфавит и таблицы не строятся заново. Размер кэша
+    ограничен, и при работе с большим числом разных алфавитов старые
+    таблицы вытесняются.
+
+    :param alphabet: Алфавит
+    :type alphabet: str
+    :param shift: Сдвиг, приведённый по модулю длины алфавита
+    :type shift: int
+    :returns: Таблицы перевода
+    :rtype: Tuple[Dict[int, int], Optional[bytes], Optional[bytes]]
+    """
+    return _substitution_table(alphabet, alphabet[shift:] + alphabet[:shift])
+
+
+@functools.lru_cache(maxsize=16)
+def _atbash_table(alphabet: str) -> _Tables:
+    """
+    Возвращает таблицы перевода для перевёрнутого алфавита.
+
+    Таблицы кэшируются по алфавиту, поэтому при повторном вызове
+    перевёрнутый алфавит и таблицы не строятся заново.
+
+    :param alphabet: Алфавит
+    :type alphabet: str
+    :returns: Таблицы перевода
+    :rtype: Tuple[Dict[int, int], Optional[bytes], Optional[bytes]]
+    """
+    return _substitution_table(alphabet, alphabet[::-1])
+
+
+def _translate(text: str, tables: _Tables) -> str:
+    """
+    Переводит текст по таблицам, одновременно проверяя его символы.
+
+    Для коротких ASCII-текстов и ASCII-алфавитов используется
+    bytes.translate.
+
+    :param text: Текст для перевода
+    :type text: str
+    :param tables: Таблицы, построенные _substitution_table
+    :type tables: Tuple[Dict[int, int], Optional[bytes], Optional[bytes]]
+    :returns: Переведённый текст
+    :rtype: str
+    :raises AlphabetError: Если текст содержит символы не из алфавита
+    """
+    table, byte_table, allowed = tables
+    if (byte_table is not None and len(text) <= _ASCII_FAST_PATH_LIMIT
+            and text.isascii()):
+        data = text.encode('ascii')
+        invalid = data.translate(None, allowed)
+        if invalid:
+            raise AlphabetError(f"Символ '{chr(invalid[0])}' не найден в алфавите")
+        return data.translate(byte_table).decode('ascii')
+
+    return text.translate(table)
+
+
+def make_caesar(key: int, alphabet: str, encrypt: bool = True) -> Callable[[str], str]:
+    """
+    Создаёт функцию шифра Цезаря с заранее подготовленной таблицей.
+
+    Таблица перевода строится один раз при создании функции, поэтому
+    при обработке нескольких текстов одним ключом повторная подготовка
+    не выполняется.
+
+    :param key: Ключ шифрования (сдвиг)
+    :type key: int
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :returns: Функция, принимающая текст и возвращающая обработанный текст
+    :rtype: Callable[[str], str]
+    """
+    shift = (key if encrypt else -key) % len(alphabet)
+    tables = _caesar_table(alphabet, shift)
+
+    def cipher(text: str) -> str:
+        return _translate(text, tables)
+
+    return cipher
+
+
+# Во сколько раз текст должен быть длиннее ключа, чтобы перевод срезами
+# был быстрее посимвольного.
+_VIGENERE_SLICE_MIN_RATIO = 16
+
+
+@functools.lru_cache(maxsize=64)
+def _vigenere_key_tables(key: str, alphabet: str,
+                         encrypt: bool) -> Tuple[_Tables, ...]:
+    """
+    Переводит ключ Виженера в таблицы сдвига по позициям ключа.
+
+    Пробелы из ключа удаляются. Результат кэшируется по ключу, алфавиту
+    и направлению, поэтому повторные вызовы с тем же ключом не очищают
+    и не проверяют его заново.
+
+    :param key: Ключ шифрования
+    :type key: str
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :returns: Таблицы перевода для каждой позиции ключа
+    :rtype: Tuple[Tuple[Dict[int, int], Optional[bytes], Optional[bytes]], ...]
+    :raises AlphabetError: Если ключ содержит символы не из алфавита
+    :raises CipherError: Если ключ пустой или состоит только из пробелов
+    """
+    key = key.replace(' ', '')
+    if not key:
+        raise CipherError("Ключ не может быть пустым")
+
+    char_to_idx, _, _ = _alphabet_tables(alphabet)
+    n = len(alphabet)
+
+    # Для каждого различного символа ключа сдвинутый алфавит строится
+    # один раз, и в цикле остаётся только выбор готовой таблицы.
+    rotations = {}
+    for char in dict.fromkeys(key):
+        try:
+            key_idx = char_to_idx[char]
+        except KeyError:
+            raise AlphabetError(f"Символ '{char}' не найден в алфавите") from None
+        shift = (key_idx if encrypt else -key_idx) % n
+        rotations[char] = _caesar_table(alphabet, shift)
+
+    return tuple(rotations[char] for char in key)
+
+
+def _vigenere_translate(text: str, key_tables: Tuple[_Tables, ...],
+                        alphabet: str) -> str:
+    """
+    Переводит текст шифром Виженера по подготовленным таблицам.
+
+    Символы text[i::klen] шифруются одной и той же буквой ключа, поэтому
+    каждый такой срез обрабатывается целиком как шифр Цезаря. Результаты
+    раскладываются по местам в заранее выделенный буфер UTF-32, где
+    каждый символ занимает ровно одну 4-байтовую ячейку. Текст короче
+    _VIGENERE_SLICE_MIN_RATIO длин ключа переводится посимвольно.
+
+    :param text: Текст для обработки
+    :type text: str
+    :param key_tables: Таблицы, построенные _vigenere_key_tables
+    :type key_tables: Tuple[Tuple[Dict[int, int], Optional[bytes], Optional[bytes]], ...]
+    :param alphabet: Алфавит, по которому построены таблицы
+    :type alphabet: str
+    :returns: Обработанный текст
+    :rtype: str
+    :raises AlphabetError: Если текст содержит символы не из алфавита
+    """
+    klen = len(key_tables)
+
+    # Срезам нужен отдельный перевод и копирование на каждую позицию ключа,
+    # поэтому они окупаются только на текстах заметно длиннее ключа.
+    if len(text) < _VIGENERE_SLICE_MIN_RATIO * klen:
+        return ''.join([
+            chr(key_tables[i % klen][0][ord(char)])
+            for i, char in enumerate(text)
+        ])
+
+    result = bytearray(4 * len(text))
+    cells = memoryview(result).cast('I')
+
+    try:
+        for i, tables in enumerate(key_tables[:len(text)]):
+            part = _translate(text[i::klen], tables)
+            cells[i::klen] = memoryview(part.encode('utf-32-le')).cast('I')
+    except AlphabetError:
+        # Срезы проверяются не в порядке текста, поэтому первый
+        # недопустимый символ ищется отдельным проходом.
+        validate_text(text, alphabet)
+        raise
+
+    return result.decode('utf-32-le')
+
+
+def make_vigenere(key: str, alphabet: str, encrypt: bool = True) -> Callable[..., str]:
+    """
+    Создаёт функцию шифра Виженера с заранее подготовленными таблицами.
+
+    Ключ проверяется и переводится в таблицы сдвигов один раз
+    при создании функции. Кроме текста, функция принимает необязательный
+    offset — позицию ключа, с которой начинается текст. Это позволяет
+    обрабатывать длинный текст по частям, продолжая ключ с нужного места.
+
+    :param key: Ключ шифрования
+    :type key: str
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :returns: Функция, принимающая текст (и offset) и возвращающая
+              обработанный текст
+    :rtype: Callable[..., str]
+    :raises AlphabetError: Если ключ содержит символы не из алфавита
+    :raises CipherError: Если ключ пустой или состоит только из пробелов
+    """
+    key_tables = _vigenere_key_tables(key, alphabet, encrypt)
+    klen = len(key_tables)
+
+    def cipher(text: str, offset: int = 0) -> str:
+        phase = offset % klen
+        tables = key_tables[phase:] + key_tables[:phase] if phase else key_tables
+        return _vigenere_translate(text, tables, alphabet)
+
+    return cipher
+
+
+def make_atbash(alphabet: str, encrypt: bool = True) -> Callable[[str], str]:
+    """
+    Создаёт функцию шифра Атбаш с заранее подготовленной таблицей.
+
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Не используется, оставлен для совместимости интерфейса
+    :type encrypt: bool
+    :returns: Функция, принимающая текст и возвращающая обработанный текст
+    :rtype: Callable[[str], str]
+    """
+    tables = _atbash_table(alphabet)
+
+    def cipher(text: str) -> str:
+        return _translate(text, tables)
+
+    return cipher
+
+
 def caesar_cipher(text: str, key: int, alphabet: str, encrypt: bool = True) -> str:
     """
     Шифрует или дешифрует текст с помощью шифра Цезаря.
@@ -90,25 +420,7 @@ def caesar_cipher(text: str, key: int, alphabet: str, encrypt: bool = True) -> s
     :rtype: str
     :raises AlphabetError: Если текст содержит символы не из алфавита
     """
-    validate_text(text, alphabet)
-
-    n = len(alphabet)
-    result = []
-
-    for char in text:
-        if char == ' ':
-            result.append(' ')
-            continue
-
-        idx = alphabet.index(char)
-        if encrypt:
-            new_idx = (idx + key) % n
-        else:
-            new_idx = (idx - key) % n
-
-        result.append(alphabet[new_idx])
-
-    return ''.join(result)
+    return make_caesar(key, alphabet, encrypt)(text)
 
 
 def vigenere_cipher(text: str, key: str, alphabet: str, encrypt: bool = True) -> str:
@@ -130,34 +442,16 @@ def vigenere_cipher(text: str, key: str, alphabet: str, encrypt: bool = True) ->
     :returns: Обработанный текст
     :rtype: str
     :raises AlphabetError: Если текст или ключ содержат символы не из алфавита
-    :raises CipherError: Если ключ пустой
+    :raises CipherError: Если ключ пустой или состоит только из пробелов
     """
-    validate_text(text, alphabet)
-    validate_text(key, alphabet)
-
-    if not key:
-        raise CipherError("Ключ не может быть пустым")
-
-    n = len(alphabet)
-    result = []
-    key = key.replace(' ', '')
-
-    for i, char in enumerate(text):
-        if char == ' ':
-            result.append(' ')
-            continue
-
-        text_idx = alphabet.index(char)
-        key_idx = alphabet.index(key[i % len(key)])
-
-        if encrypt:
-            new_idx = (text_idx + key_idx) % n
-        else:
-            new_idx = (text_idx - key_idx) % n
-
-        result.append(alphabet[new_idx])
+    try:
+        cipher = make_vigenere(key, alphabet, encrypt)
+    except CipherError:
+        # Ошибки в тексте важнее ошибок в ключе: текст проверяется первым.
+        validate_text(text, alphabet)
+        raise
 
-    return ''.join(result)
+    return cipher(text)
 
 
 def atbash_cipher(text: str, alphabet: str, encrypt: bool = True) -> str:
@@ -180,17 +474,79 @@ def atbash_cipher(text: str, alphabet: str, encrypt: bool = True) -> str:
     :rtype: str
     :raises AlphabetError: Если текст содержит символы не из алфавита
     """
-    validate_text(text, alphabet)
+    return make_atbash(alphabet, encrypt)(text)
 
-    reversed_alphabet = alphabet[::-1]
-    result = []
 
-    for char in text:
-        if char == ' ':
-            result.append(' ')
-            continue
+def caesar_cipher_iter(chunks: Iterable[str], key: int, alphabet: str,
+                       encrypt: bool = True) -> Iterator[str]:
+    """
+    Шифрует или дешифрует поток текста шифром Цезаря по частям.
+
+    Каждая часть входного потока обрабатывается сразу и выдаётся
+    отдельно, поэтому большой текст (например, файл) не нужно целиком
+    держать в памяти.
+
+    :param chunks: Части текста для обработки
+    :type chunks: Iterable[str]
+    :param key: Ключ шифрования (сдвиг)
+    :type key: int
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :returns: Обработанные части текста в том же порядке
+    :rtype: Iterator[str]
+    :raises AlphabetError: Если текст содержит символы не из алфавита
+    """
+    cipher = make_caesar(key, alphabet, encrypt)
+    for chunk in chunks:
+        yield cipher(chunk)
+
+
+def vigenere_cipher_iter(chunks: Iterable[str], key: str, alphabet: str,
+                         encrypt: bool = True) -> Iterator[str]:
+    """
+    Шифрует или дешифрует поток текста шифром Виженера по частям.
 
-        idx = alphabet.index(char)
-        result.append(reversed_alphabet[idx])
+    Позиция в ключе продолжается между частями, поэтому результат
+    совпадает с обработкой склеенного текста целиком.
 
-    return ''.join(result)
\ No newline at end of file
+    :param chunks: Части текста для обработки
+    :type chunks: Iterable[str]
+    :param key: Ключ шифрования
+    :type key: str
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :returns: Обработанные части текста в том же порядке
+    :rtype: Iterator[str]
+    :raises AlphabetError: Если текст или ключ содержат символы не из алфавита
+    :raises CipherError: Если ключ пустой или состоит только из пробелов
+    """
+    cipher = make_vigenere(key, alphabet, encrypt)
+    offset = 0
+
+    for chunk in chunks:
+        yield cipher(chunk, offset)
+        offset += len(chunk)
+
+
+def atbash_cipher_iter(chunks: Iterable[str], alphabet: str,
+                       encrypt: bool = True) -> Iterator[str]:
+    """
+    Шифрует или дешифрует поток текста шифром Атбаш по частям.
+
+    :param chunks: Части текста для обработки
+    :type chunks: Iterable[str]
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Не используется, оставлен для совместимости интерфейса
+    :type encrypt: bool
+    :returns: Обработанные части текста в том же порядке
+    :rtype: Iterator[str]
+    :raises AlphabetError: Если текст содержит символы не из алфавита
+    """
+    cipher = make_atbash(alphabet, encrypt)
+    for chunk in chunks:
+        yield cipher(chunk)
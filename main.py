@@ -1,16 +1,22 @@
 """Консольное приложение для шифрования и дешифрования текста."""
 
+import functools
 import os
-import sys
-from typing import Optional
-
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import re
+import stat
+import tempfile
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
 
 from ciphers import (
-    read_alphabet, caesar_cipher, vigenere_cipher,
-    atbash_cipher, AlphabetError, CipherError
+    read_alphabet, make_caesar, make_vigenere, make_atbash,
+    AlphabetError, CipherError
 )
 
+# Размер блока (в символах), которым читается входной файл.
+CHUNK_SIZE = 64 * 1024
+
+_LINE_BREAK = re.compile(r'(\r\n|\r|\n)')
+
 def get_alphabet_file() -> str:
     """
     Запрашивает у пользователя путь к файлу с алфавитом.
@@ -125,6 +131,181 @@ def get_text() -> str:
         print("Ошибка: текст не может быть пустым")
 
 
+def get_text_source() -> bool:
+    """
+    Запрашивает источник текста (консоль/файл).
+
+    :returns: True - текст из файла, False - ввод с консоли
+    :rtype: bool
+    """
+    while True:
+        source = input("Источник текста (1 - консоль, 2 - файл): ").strip()
+        if source == '1':
+            return False
+        elif source == '2':
+            return True
+        print("Ошибка: введите 1 или 2")
+
+
+def get_file_paths() -> Tuple[str, str]:
+    """
+    Запрашивает пути к входному и выходному файлам.
+
+    Функция в цикле запрашивает путь к существующему входному файлу,
+    а затем путь, по которому будет записан результат.
+
+    :returns: Путь к входному файлу и путь к файлу результата
+    :rtype: Tuple[str, str]
+    """
+    while True:
+        input_path = input("Введите путь к файлу с текстом: ").strip()
+        if os.path.isfile(input_path):
+            break
+        print(f"Ошибка: файл '{input_path}' не найден. Попробуйте снова.")
+
+    while True:
+        output_path = input("Введите путь к файлу для результата: ").strip()
+        if not output_path:
+            print("Ошибка: путь не может быть пустым")
+        elif is_same_file(input_path, output_path):
+            print("Ошибка: файл результата должен отличаться от входного")
+        else:
+            return input_path, output_path
+
+
+def is_same_file(first_path: str, second_path: str) -> bool:
+    """
+    Проверяет, указывают ли два пути на один и тот же файл.
+
+    :param first_path: Первый путь
+    :type first_path: str
+    :param second_path: Второй путь
+    :type second_path: str
+    :returns: True, если пути указывают на один файл
+    :rtype: bool
+    """
+    if os.path.abspath(first_path) == os.path.abspath(second_path):
+        return True
+
+    return (os.path.exists(first_path) and os.path.exists(second_path)
+            and os.path.samefile(first_path, second_path))
+
+
+def output_file_mode(output_path: str) -> int:
+    """
+    Определяет права доступа для файла результата.
+
+    Если файл уже существует, его права сохраняются. Иначе используются
+    права, которые получил бы файл, созданный обычным open, с учётом umask.
+
+    :param output_path: Путь к файлу результата
+    :type output_path: str
+    :returns: Права доступа к файлу
+    :rtype: int
+    """
+    if os.path.exists(output_path):
+        return stat.S_IMODE(os.stat(output_path).st_mode)
+
+    # umask нельзя прочитать, не установив новое значение.
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return 0o666 & ~umask
+
+
+def read_blocks(fin: TextIO) -> Iterator[Tuple[List[str], List[str]]]:
+    """
+    Читает файл блоками и разбирает каждый блок на строки и их разделители.
+
+    Файл читается блоками по CHUNK_SIZE символов, поэтому даже очень
+    длинная строка не загружается в память целиком. Разделителями
+    считаются '\\r\\n', '\\r' и '\\n'; они возвращаются как есть, чтобы
+    при записи результата переводы строк не менялись. Разделителей
+    в блоке всегда на один меньше, чем фрагментов.
+
+    :param fin: Входной файл, открытый с newline=''
+    :type fin: TextIO
+    :returns: Для каждого блока — фрагменты текста без переводов строк
+              и разделители между ними
+    :rtype: Iterator[Tuple[List[str], List[str]]]
+    """
+    for block in iter(functools.partial(fin.read, CHUNK_SIZE), ''):
+        parts = _LINE_BREAK.split(block)
+        yield parts[::2], parts[1::2]
+
+
+def process_file(cipher_type: int, key: Optional[Union[int, str]],
+                 alphabet: str, encrypt: bool,
+                 input_path: str, output_path: str) -> None:
+    """
+    Обрабатывает файл по частям и записывает результат в другой файл.
+
+    Файл читается и записывается блоками ограниченного размера, поэтому
+    файл любого размера не загружается в память целиком. Переводы строк
+    ('\\n', '\\r\\n', '\\r') сохраняются как есть, в шифровании не участвуют
+    и не сдвигают позицию ключа Виженера.
+
+    :param cipher_type: Тип шифра (1-3)
+    :type cipher_type: int
+    :param key: Ключ шифрования (None для Атбаш)
+    :type key: Optional[Union[int, str]]
+    :param alphabet: Алфавит для шифрования
+    :type alphabet: str
+    :param encrypt: Флаг операции (True - шифрование, False - дешифрование)
+    :type encrypt: bool
+    :param input_path: Путь к входному файлу
+    :type input_path: str
+    :param output_path: Путь к файлу результата
+    :type output_path: str
+    :raises AlphabetError: Если текст или ключ содержат символы не из алфавита
+    :raises CipherError: Если ключ некорректен
+    :raises ValueError: Если входной файл совпадает с файлом результата
+    """
+    if is_same_file(input_path, output_path):
+        raise ValueError("Файл результата должен отличаться от входного")
+
+    # Результат пишется во временный файл рядом с итоговым и заменяет его
+    # только после успешной обработки, чтобы при ошибке не оставался
+    # недописанный файл, похожий на результат.
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+
+    try:
+        with open(fd, 'w', encoding='utf-8', newline='') as fout, \
+                open(input_path, 'r', encoding='utf-8', newline='') as fin:
+            if cipher_type == 1:
+                cipher = make_caesar(key, alphabet, encrypt)
+            elif cipher_type == 2:
+                cipher = make_vigenere(key, alphabet, encrypt)
+            elif cipher_type == 3:
+                cipher = make_atbash(alphabet, encrypt)
+
+            offset = 0
+            for segments, separators in read_blocks(fin):
+                # Блок без переводов строк шифруется одним вызовом.
+                # Для Виженера позиция ключа продолжается с предыдущего
+                # блока, а переводы строк её не сдвигают.
+                text = ''.join(segments)
+                if cipher_type == 2:
+                    result = cipher(text, offset)
+                else:
+                    result = cipher(text)
+                offset += len(text)
+
+                start = 0
+                for segment, separator in zip(segments, separators + ['']):
+                    end = start + len(segment)
+                    fout.write(result[start:end])
+                    fout.write(separator)
+                    start = end
+
+        os.chmod(temp_path, output_file_mode(output_path))
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 def main() -> None:
     """
     Основная функция приложения.
@@ -132,8 +313,9 @@ def main() -> None:
     Функция управляет основным циклом работы программы:
     1. Запрашивает файл с алфавитом
     2. В цикле предлагает выбрать шифр, операцию, ввести ключ и текст
+       (с консоли или из файла)
     3. Выполняет шифрование/дешифрование
-    4. Выводит результат
+    4. Выводит результат или записывает его в файл
     5. Предлагает продолжить или выйти
 
     Обрабатывает основные исключения и выводит понятные сообщения об ошибках.
@@ -158,26 +340,38 @@ def main() -> None:
 
             key = get_key(cipher_choice, encrypt)
 
-            text = get_text()
+            from_file = get_text_source()
 
             try:
-                if cipher_choice == 1:
-                    result = caesar_cipher(text, key, alphabet, encrypt)
-                elif cipher_choice == 2:
-                    result = vigenere_cipher(text, key, alphabet, encrypt)
-                elif cipher_choice == 3:
-                    result = atbash_cipher(text, alphabet, encrypt)
-
-                operation = "Зашифрованный" if encrypt else "Расшифрованный"
-                print(f"\n{operation} текст:")
-                print("-" * 30)
-                print(result)
-                print("-" * 30)
+                if from_file:
+                    input_path, output_path = get_file_paths()
+                    process_file(cipher_choice, key, alphabet, encrypt,
+                                 input_path, output_path)
+                    print(f"\nРезультат записан в файл '{output_path}'")
+                else:
+                    text = get_text()
+
+                    if cipher_choice == 1:
+                        cipher = make_caesar(key, alphabet, encrypt)
+                    elif cipher_choice == 2:
+                        cipher = make_vigenere(key, alphabet, encrypt)
+                    elif cipher_choice == 3:
+                        cipher = make_atbash(alphabet, encrypt)
+
+                    result = cipher(text)
+
+                    operation = "Зашифрованный" if encrypt else "Расшифрованный"
+                    print(f"\n{operation} текст:")
+                    print("-" * 30)
+                    print(result)
+                    print("-" * 30)
 
             except AlphabetError as e:
                 print(f"Ошибка в тексте: {e}")
             except CipherError as e:
                 print(f"Ошибка шифрования: {e}")
+            except (OSError, ValueError) as e:
+                print(f"Ошибка работы с файлом: {e}")
 
             cont = input("\nПродолжить? (да/нет): ").strip().lower()
             if cont not in ['да', 'д', 'yes', 'y']:
@@ -5,7 +5,9 @@ import tempfile
 import os
 from ciphers import (
     read_alphabet, validate_text, caesar_cipher,
-    vigenere_cipher, atbash_cipher, AlphabetError, CipherError
+    vigenere_cipher, atbash_cipher, make_caesar, make_vigenere, make_atbash,
+    caesar_cipher_iter, vigenere_cipher_iter, atbash_cipher_iter,
+    AlphabetError, CipherError
 )
 
 
@@ -67,6 +69,26 @@ class TestCiphers(unittest.TestCase):
 
         self.assertEqual(decrypted, text)
 
+    def test_caesar_cipher_ascii_alphabet(self):
+        """Тест шифра Цезаря на ASCII-алфавите."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+
+        encrypted = caesar_cipher("abc xyz", 1, alphabet, encrypt=True)
+
+        self.assertEqual(encrypted, "bcd yza")
+        self.assertEqual(caesar_cipher(encrypted, 1, alphabet, encrypt=False), "abc xyz")
+
+    def test_caesar_cipher_ascii_long_text(self):
+        """Тест шифра Цезаря на длинном ASCII-тексте и ASCII-алфавите."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+
+        for count in (1, 1000):
+            encrypted = caesar_cipher("abc xyz" * count, 1, alphabet, encrypt=True)
+            self.assertEqual(encrypted, "bcd yza" * count)
+
+        with self.assertRaises(AlphabetError):
+            caesar_cipher("abc xyz" * 1000 + "!", 1, alphabet, encrypt=True)
+
     def test_vigenere_cipher_encrypt_decrypt(self):
         """Тест шифра Виженера: шифрование и дешифрование."""
         text = "программирование"
@@ -77,11 +99,22 @@ class TestCiphers(unittest.TestCase):
 
         self.assertEqual(decrypted, text)
 
+    def test_vigenere_cipher_short_and_long_text(self):
+        """Тест шифра Виженера на текстах короче и длиннее порога срезов."""
+        self.assertEqual(vigenere_cipher("абв я", "бв", self.alphabet), "бгг а")
+        self.assertEqual(vigenere_cipher("абв я" * 20, "бв", self.alphabet),
+                         ("бгг а" + "ввд б") * 10)
+
     def test_vigenere_cipher_empty_key(self):
         """Тест шифра Виженера с пустым ключом."""
         with self.assertRaises(CipherError):
             vigenere_cipher("текст", "", self.alphabet, encrypt=True)
 
+    def test_vigenere_cipher_space_only_key(self):
+        """Тест шифра Виженера с ключом только из пробелов."""
+        with self.assertRaises(CipherError):
+            vigenere_cipher("текст", "   ", self.alphabet, encrypt=True)
+
     def test_atbash_cipher_symmetry(self):
         """Тест симметричности шифра Атбаш."""
         text = "шифрование"
@@ -91,11 +124,73 @@ class TestCiphers(unittest.TestCase):
 
         self.assertEqual(decrypted, text)
 
+    def test_make_caesar(self):
+        """Тест фабрики шифра Цезаря на известных значениях."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        encrypt = make_caesar(1, alphabet, encrypt=True)
+        decrypt = make_caesar(1, alphabet, encrypt=False)
+
+        self.assertEqual(encrypt("abc xyz"), "bcd yza")
+        self.assertEqual(encrypt("z"), "a")
+        self.assertEqual(decrypt("bcd yza"), "abc xyz")
+
+    def test_make_vigenere(self):
+        """Тест фабрики шифра Виженера на известных значениях."""
+        encrypt = make_vigenere("бв", self.alphabet, encrypt=True)
+        decrypt = make_vigenere("бв", self.alphabet, encrypt=False)
+
+        self.assertEqual(encrypt("абв я"), "бгг а")
+        self.assertEqual(decrypt("бгг а"), "абв я")
+        self.assertEqual(encrypt("бв я", offset=1), "гг а")
+
+    def test_make_atbash(self):
+        """Тест фабрики шифра Атбаш на известных значениях."""
+        cipher = make_atbash(self.alphabet)
+
+        self.assertEqual(cipher("абв я"), "яюэ а")
+        self.assertEqual(cipher("яюэ а"), "абв я")
+
+    def test_atbash_cipher_iter(self):
+        """Тест потоковой обработки текста шифром Атбаш."""
+        result = list(atbash_cipher_iter(["аб", "в я", ""], self.alphabet))
+
+        self.assertEqual(result, ["яю", "э а", ""])
+
+    def test_cipher_iter_matches_whole_text(self):
+        """Тест потоковой обработки текста по частям."""
+        chunks = ["прив", "ет м", "ир"]
+        text = "".join(chunks)
+
+        caesar = "".join(caesar_cipher_iter(chunks, 3, self.alphabet))
+        vigenere = "".join(vigenere_cipher_iter(chunks, "ключ", self.alphabet))
+
+        self.assertEqual(caesar, caesar_cipher(text, 3, self.alphabet))
+        self.assertEqual(vigenere, vigenere_cipher(text, "ключ", self.alphabet))
+
     def test_caesar_cipher_invalid_text(self):
         """Тест шифра Цезаря с недопустимым текстом."""
         with self.assertRaises(AlphabetError):
             caesar_cipher("hello", 1, self.alphabet, encrypt=True)
 
+    def test_vigenere_cipher_invalid_text(self):
+        """Тест шифра Виженера с недопустимым текстом."""
+        with self.assertRaises(AlphabetError):
+            vigenere_cipher("привет world", "ключ", self.alphabet, encrypt=True)
+
+    def test_vigenere_cipher_reports_first_invalid_char(self):
+        """Тест: шифр Виженера сообщает о первом недопустимом символе."""
+        for text, char in (("аб!в?", "!"), ("аб?в!" + "в" * 100, "?")):
+            with self.assertRaises(AlphabetError) as cm:
+                vigenere_cipher(text, "ключ", self.alphabet, encrypt=True)
+            self.assertIn(f"'{char}'", str(cm.exception))
+
+    def test_vigenere_cipher_invalid_text_and_key(self):
+        """Тест: при ошибках в тексте и ключе сообщается об ошибке в тексте."""
+        for key in ("key", ""):
+            with self.assertRaises(AlphabetError) as cm:
+                vigenere_cipher("при!вет", key, self.alphabet, encrypt=True)
+            self.assertIn("'!'", str(cm.exception))
+
     def test_vigenere_cipher_invalid_key(self):
         """Тест шифра Виженера с недопустимым ключом."""
         with self.assertRaises(AlphabetError):
@@ -0,0 +1,141 @@
+"""Тесты для консольного приложения."""
+
+import unittest
+import tempfile
+import os
+import stat
+import main
+from main import process_file, is_same_file
+from ciphers import vigenere_cipher, AlphabetError
+
+
+class TestProcessFile(unittest.TestCase):
+    """Тесты обработки файлов."""
+
+    def setUp(self):
+        """Создание временного каталога с входным файлом."""
+        self.alphabet = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.temp_dir.name, "in.txt")
+        self.output_path = os.path.join(self.temp_dir.name, "out.txt")
+
+    def tearDown(self):
+        """Удаление временного каталога."""
+        self.temp_dir.cleanup()
+
+    def write(self, path, text):
+        """Запись текста в файл."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def read(self, path):
+        """Чтение текста из файла."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_process_file_caesar(self):
+        """Тест шифрования файла шифром Цезаря."""
+        self.write(self.input_path, "привет мир\nабв\n")
+
+        process_file(1, 1, self.alphabet, True, self.input_path, self.output_path)
+
+        self.assertEqual(self.read(self.output_path), "рсйгёу нйс\nбвг\n")
+
+    def test_process_file_keeps_newlines(self):
+        """Тест: переводы строк сохраняются, лишний в конец не добавляется."""
+        self.write(self.input_path, "абв\n\nгде")
+
+        process_file(1, 1, self.alphabet, True, self.input_path, self.output_path)
+
+        self.assertEqual(self.read(self.output_path), "бвг\n\nдеё")
+
+    def test_process_file_keeps_crlf(self):
+        """Тест: переводы строк '\\r\\n' и '\\r' сохраняются без изменений."""
+        with open(self.input_path, 'wb') as f:
+            f.write("абв\r\nгде\rя\r\n".encode('utf-8'))
+
+        process_file(1, 1, self.alphabet, True, self.input_path, self.output_path)
+
+        with open(self.output_path, 'rb') as f:
+            self.assertEqual(f.read().decode('utf-8'), "бвг\r\nдеё\rа\r\n")
+
+    def test_process_file_crlf_across_blocks(self):
+        """Тест: '\\r\\n' на границе блоков чтения сохраняется."""
+        text = "абв\r\nгде\r\n" * 10
+        with open(self.input_path, 'wb') as f:
+            f.write(text.encode('utf-8'))
+
+        chunk_size = main.CHUNK_SIZE
+        main.CHUNK_SIZE = 4
+        try:
+            process_file(2, "ключ", self.alphabet, True, self.input_path, self.output_path)
+        finally:
+            main.CHUNK_SIZE = chunk_size
+
+        expected = vigenere_cipher(text.replace("\r\n", ""), "ключ", self.alphabet)
+        with open(self.output_path, 'rb') as f:
+            result = f.read().decode('utf-8')
+        self.assertEqual(result.replace("\r\n", ""), expected)
+        self.assertEqual(result.count("\r\n"), 20)
+
+    def test_process_file_long_line(self):
+        """Тест обработки строки длиннее блока чтения."""
+        text = "шифр виженера " * (main.CHUNK_SIZE // 5)
+        self.write(self.input_path, text + "\n" + text)
+
+        process_file(2, "ключ", self.alphabet, True, self.input_path, self.output_path)
+
+        expected = vigenere_cipher(text + text, "ключ", self.alphabet)
+        self.assertEqual(self.read(self.output_path),
+                         expected[:len(text)] + "\n" + expected[len(text):])
+
+    def test_process_file_same_path(self):
+        """Тест: входной файл не перезаписывается результатом."""
+        self.write(self.input_path, "привет\n")
+        same_path = os.path.join(self.temp_dir.name, ".", "in.txt")
+
+        self.assertTrue(is_same_file(self.input_path, same_path))
+        with self.assertRaises(ValueError):
+            process_file(1, 3, self.alphabet, True, self.input_path, same_path)
+
+        self.assertEqual(self.read(self.input_path), "привет\n")
+
+    def test_process_file_error_keeps_output(self):
+        """Тест: при ошибке файл результата не создаётся и не меняется."""
+        self.write(self.input_path, "привет\nhello\n")
+
+        with self.assertRaises(AlphabetError):
+            process_file(1, 3, self.alphabet, True, self.input_path, self.output_path)
+        self.assertFalse(os.path.exists(self.output_path))
+
+        self.write(self.output_path, "старый результат")
+        with self.assertRaises(AlphabetError):
+            process_file(1, 3, self.alphabet, True, self.input_path, self.output_path)
+        self.assertEqual(self.read(self.output_path), "старый результат")
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ["in.txt", "out.txt"])
+
+    def test_process_file_permissions(self):
+        """Тест прав доступа к файлу результата."""
+        self.write(self.input_path, "абв")
+        umask = os.umask(0o022)
+        try:
+            process_file(1, 1, self.alphabet, True, self.input_path, self.output_path)
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.output_path).st_mode), 0o644)
+
+        os.chmod(self.output_path, 0o640)
+        process_file(1, 1, self.alphabet, True, self.input_path, self.output_path)
+        self.assertEqual(stat.S_IMODE(os.stat(self.output_path).st_mode), 0o640)
+
+    def test_process_file_directory_input(self):
+        """Тест: каталог вместо входного файла не оставляет временных файлов."""
+        with self.assertRaises(OSError):
+            process_file(1, 3, self.alphabet, True, self.temp_dir.name, self.output_path)
+
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()